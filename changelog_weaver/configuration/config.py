@@ -1,6 +1,7 @@
 """ Configuration class for the application. """
 
-from typing import Tuple, Optional
+from functools import cached_property, lru_cache
+from typing import Callable, Dict, List, Tuple, Optional
 from urllib.parse import urlparse, unquote
 from ..typings import Project, Platform, PlatformInfo, Notes, ApiDetails
 from .base_config import BaseConfig, ENVVARS
@@ -12,6 +13,7 @@ from ..logger import get_logger
 log = get_logger(__name__)
 
 
+# pylint: disable=too-many-instance-attributes
 class Config(BaseConfig):
     """Configuration class for the application.
 
@@ -20,9 +22,9 @@ class Config(BaseConfig):
         output_folder (str): The folder to save the output file in. Default is "Releases".
         software (Optional[Software]): The software configuration. Default is None and is self-initialized.
         devops (Optional[DevOps]): The DevOps configuration. Default is None and is self-initialized.
-        model (Optional[Model]): The model configuration. Default is None and is self-initialized.
-        prompts (Optional[Prompt]): The prompt configuration. Default is None and is self-initialized.
-        output (Optional[Output]): The output configuration. Default is None and is self-initialized.
+        model (Optional[Model]): The model configuration. Default is None and is initialized on first access.
+        prompts (Optional[Prompt]): The prompt configuration. Default is None and is initialized on first access.
+        output (Optional[Output]): The output configuration. Default is None and is initialized on first access.
     """
 
     def __init__(
@@ -58,30 +60,125 @@ class Config(BaseConfig):
             )
             raise
 
-        self.model = model or Model(
-            api_details=ApiDetails(
+        # Model, Prompts and Output are built lazily on first access (see the
+        # cached properties below); explicitly supplied instances take precedence.
+        if model is not None:
+            self.model = model
+        if prompts is not None:
+            self.prompts = prompts
+        if output is not None:
+            self.output = output
+        self._model_args = (
+            ApiDetails(
                 key=env.get(ENVVARS.GPT_API_KEY, ""),
                 url=env.get(ENVVARS.MODEL_BASE_URL, ""),
                 model_name=env.get(ENVVARS.MODEL, ""),
             ),
-            item_summary=env.get(ENVVARS.GET_ITEM_SUMMARY, "True").lower() == "true",
-            changelog_summary=env.get(ENVVARS.GET_CHANGELOG_SUMMARY, "True").lower()
-            == "true",
+            env.get(ENVVARS.GET_ITEM_SUMMARY, "True").lower() == "true",
+            env.get(ENVVARS.GET_CHANGELOG_SUMMARY, "True").lower() == "true",
         )
-        self.prompts = prompts or Prompts(
+        self._prompts_args = (
             self.project.name,
             self.project.brief,
             self.project.changelog.notes,
         )
-        self.output = output or Output(
-            folder=env.get(ENVVARS.OUTPUT_FOLDER, "Releases"),
-            name=self.project.name,
-            version=self.project.version,
+        self._output_args = (
+            env.get(ENVVARS.OUTPUT_FOLDER, "Releases"),
+            self.project.name,
+            self.project.version,
         )
         self.include_commits = (
             env.get(ENVVARS.INCLUDE_COMMITS, "True").lower() == "true"
         )
 
+    @cached_property
+    def model(self) -> Model:
+        """The model configuration, created on first access."""
+        return Model(*self._model_args)
+
+    @cached_property
+    def prompts(self) -> Prompts:
+        """The prompt configuration, created on first access."""
+        return Prompts(*self._prompts_args)
+
+    @cached_property
+    def output(self) -> Output:
+        """The output configuration, created on first access."""
+        return Output(*self._output_args)
+
+
+def _github_info(  # pylint: disable=unused-argument
+    host: str, path_parts: List[str], url: str
+) -> Tuple[str, str, str]:
+    if len(path_parts) < 2:
+        raise ValueError(f"Invalid GitHub URL: {url}")
+    return f"{path_parts[0]}/{path_parts[1]}", path_parts[0], "https://api.github.com"
+
+
+def _ado_info(  # pylint: disable=unused-argument
+    host: str, path_parts: List[str], url: str
+) -> Tuple[str, str, str]:
+    if len(path_parts) < 2:
+        raise ValueError(f"Invalid Azure DevOps URL: {url}")
+    return unquote(path_parts[1]), path_parts[0], "https://dev.azure.com/"
+
+
+def _old_ado_info(
+    host: str, path_parts: List[str], url: str
+) -> Tuple[str, str, str]:
+    host_parts = host.split(".")
+    if len(host_parts) < 2:
+        raise ValueError(f"Invalid Azure DevOps URL: {url}")
+    organization = host_parts[0]
+    if len(path_parts) < 1:
+        raise ValueError(f"Invalid Azure DevOps URL: {url}")
+    return (
+        unquote(path_parts[0]),
+        organization,
+        f"https://{organization}.visualstudio.com",
+    )
+
+
+_PlatformHandler = Callable[[str, List[str], str], Tuple[str, str, str]]
+
+_NETLOC_DISPATCH: Dict[str, Tuple[_PlatformHandler, Platform]] = {
+    "github.com": (_github_info, Platform.GITHUB),
+    "dev.azure.com": (_ado_info, Platform.AZURE_DEVOPS),
+    "visualstudio.com": (_old_ado_info, Platform.AZURE_DEVOPS),
+}
+
+# Hosts that may also be matched as a domain suffix (e.g. org.visualstudio.com)
+_SUFFIX_NETLOCS = ("dev.azure.com", "visualstudio.com")
+
+
+def _suffix_match(host: str) -> Optional[Tuple[_PlatformHandler, Platform]]:
+    """Return the (handler, platform) entry for a host name, or None if unsupported."""
+    match = _NETLOC_DISPATCH.get(host)
+    if match is not None:
+        return match
+    for suffix in _SUFFIX_NETLOCS:
+        if host.endswith("." + suffix):
+            return _NETLOC_DISPATCH[suffix]
+    return None
+
+
+@lru_cache(maxsize=32)
+def _parse_platform_url(url: str) -> Tuple[str, str, str, Platform]:
+    """Parse a project URL into (project name, organization, base URL, platform).
+
+    Only immutable values are cached; the mutable Project is built by the caller.
+    """
+    parsed_url = urlparse(url)
+    # hostname drops any userinfo (org@dev.azure.com) and port, and is lowercased
+    host = parsed_url.hostname or ""
+    dispatch = _suffix_match(host)
+    if dispatch is None:
+        raise ValueError(f"Unable to determine platform from URL: {url}")
+    handler, platform = dispatch
+    path_parts = parsed_url.path.strip("/").split("/")
+    project_name, org, base_url = handler(host, path_parts, url)
+    return project_name, org, base_url, platform
+
 
 # pylint: disable=too-many-arguments
 # pylint: disable=too-many-locals
@@ -115,47 +212,7 @@ def parse_project(
     Raises:
         ValueError: If the platform cannot be determined from the URL or if required information is missing.
     """
-    parsed_url = urlparse(url)
-
-    def get_github_info() -> Tuple[str, str, str]:
-        parts = parsed_url.path.strip("/").split("/")
-        if len(parts) < 2:
-            raise ValueError(f"Invalid GitHub URL: {url}")
-        return f"{parts[0]}/{parts[1]}", parts[0], "https://api.github.com"
-
-    def get_azure_devops_info() -> Tuple[str, str, str]:
-        parts = parsed_url.path.strip("/").split("/")
-        if len(parts) < 2:
-            raise ValueError(f"Invalid Azure DevOps URL: {url}")
-        return unquote(parts[1]), parts[0], "https://dev.azure.com/"
-
-    def get_old_azure_devops_info() -> Tuple[str, str, str]:
-        parts = parsed_url.netloc.split(".")
-        if len(parts) < 2:
-            raise ValueError(f"Invalid Azure DevOps URL: {url}")
-        organization = parts[0]
-        project_parts = parsed_url.path.strip("/").split("/")
-        if len(project_parts) < 1:
-            raise ValueError(f"Invalid Azure DevOps URL: {url}")
-        return (
-            unquote(project_parts[0]),
-            organization,
-            f"https://{organization}.visualstudio.com",
-        )
-
-    if parsed_url.netloc == "github.com":
-        project_name, org, base_url = get_github_info()
-        platform = Platform.GITHUB
-    elif (
-        parsed_url.netloc.endswith("azure.com") and "dev.azure.com" in parsed_url.netloc
-    ):
-        project_name, org, base_url = get_azure_devops_info()
-        platform = Platform.AZURE_DEVOPS
-    elif parsed_url.netloc.endswith("visualstudio.com"):
-        project_name, org, base_url = get_old_azure_devops_info()
-        platform = Platform.AZURE_DEVOPS
-    else:
-        raise ValueError(f"Unable to determine platform from URL: {url}")
+    project_name, org, base_url, platform = _parse_platform_url(url)
 
     platform_info = PlatformInfo(
         platform=platform,
@@ -1,5 +1,6 @@
 """ This module contains the Model class for the GPT model."""
 
+import asyncio
 import re
 
 # Third party imports
@@ -22,21 +23,31 @@ class Model:
         model_name (str): The name of the GPT model.
         model (str): The name of the GPT model.
         models (List[Dict[str, Any]]): A list of available GPT models.
+        max_concurrency (int): The maximum number of concurrent summary requests
+            (at least 1). Only set through the constructor, not the .env file.
+        max_comment_chars (int): The maximum length of work item comments sent in a
+            prompt. Only set through the constructor, not the .env file.
     """
 
     item_summary: bool = True
     changelog_summary: bool = True
+    max_concurrency: int = 8
+    max_comment_chars: int = 4000
 
     def __init__(
         self,
         api_details: ApiDetails,
         item_summary: bool = True,
         changelog_summary: bool = True,
+        max_concurrency: int = 8,
+        max_comment_chars: int = 4000,
     ):
         self.client = openai.OpenAI(api_key=api_details.key)
         self.api_details = api_details
         self.item_summary = item_summary
         self.changelog_summary = changelog_summary
+        self.max_concurrency = max_concurrency
+        self.max_comment_chars = max_comment_chars
         log.info("Model initialized: %s", self.api_details.model_name)
         if self.authenticate():
             log.info("Model authenticated successfully")
@@ -77,7 +88,10 @@ class Model:
 
     async def _openai_request(self, prompt: str) -> str:
         try:
-            response = self.client.chat.completions.create(
+            # Run the blocking client call in a worker thread so concurrent
+            # summaries overlap instead of running one after another
+            response = await asyncio.to_thread(
+                self.client.chat.completions.create,
                 model=self.api_details.model_name,
                 messages=[{"role": "user", "content": prompt}],
                 stream=False,
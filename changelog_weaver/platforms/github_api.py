@@ -3,6 +3,7 @@
 import asyncio
 from typing import List, Optional, Dict, Union, Tuple
 from datetime import datetime
+from functools import cached_property
 from github import Github
 from github.Issue import Issue
 from github.PullRequest import PullRequest
@@ -21,8 +22,6 @@ class GitHubAPI:
     def __init__(self, config):
         """Initialize the GitHubAPI class."""
         self.config = config
-        self.client: Github = config.client
-        self.repo: Repository = self.client.get_repo(self.config.repo_name)
         self.branch: Optional[str] = config.branch
         self.from_tag: Optional[str] = config.from_tag
         self.to_tag: Optional[str] = config.to_tag
@@ -32,6 +31,16 @@ class GitHubAPI:
         )
         self.issue_types: Dict[str, WorkItemType] = {}
 
+    @property
+    def client(self) -> Github:
+        """The GitHub client, created by the config on first access."""
+        return self.config.client
+
+    @cached_property
+    def repo(self) -> Repository:
+        """The GitHub repository, fetched on first access."""
+        return self.client.get_repo(self.config.repo_name)
+
     async def initialize(self):
         """Initialize the API by fetching issue types."""
         await self.fetch_issue_types()
@@ -303,7 +312,7 @@ class GitHubAPI:
             orphan=False,
             # Filter out items that are actually PRs
             children=[
-                HierarchicalWorkItem(**issue.__dict__)
+                HierarchicalWorkItem.from_work_item(issue)
                 for issue in issues
                 if not hasattr(issue, "pull_request")
             ],
@@ -316,7 +325,9 @@ class GitHubAPI:
             icon="https://github.githubassets.com/images/modules/git-pull-request.svg",
             root=True,
             orphan=False,
-            children=[HierarchicalWorkItem(**pr.__dict__) for pr in pull_requests],
+            children=[
+                HierarchicalWorkItem.from_work_item(pr) for pr in pull_requests
+            ],
         )
         return [issues_root, prs_root]
     
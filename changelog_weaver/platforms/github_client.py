@@ -1,13 +1,20 @@
 """This module contains the GitHub platform client implementation."""
 
 from typing import List, Optional
-from dataclasses import dataclass, field
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
 from github import Github
 from .platform_client import PlatformClient
 from ..typings import WorkItem, WorkItemType, HierarchicalWorkItem, CommitInfo
 from .github_api import GitHubAPI
 
 
+@lru_cache(maxsize=4)
+def _get_github(access_token: str) -> Github:
+    """Return a shared GitHub client for the given access token."""
+    return Github(access_token)
+
+
 @dataclass
 class GitHubConfig:
     """Configuration class for the GitHub platform."""
@@ -20,10 +27,11 @@ class GitHubConfig:
     # Add these two lines
     from_date: Optional[str] = None
     to_date: Optional[str] = None
-    client: Github = field(init=False)
 
-    def __post_init__(self):
-        self.client = Github(self.access_token)
+    @cached_property
+    def client(self) -> Github:
+        """The GitHub client, shared between configs using the same token."""
+        return _get_github(self.access_token)
 
 
 class GitHubPlatformClient(PlatformClient):
@@ -1,11 +1,16 @@
 """ Base types for the changelog_weaver package. """
 
+import sys
 from typing import List, Optional
 from enum import Enum
 from dataclasses import dataclass, field
 
+# Slotted dataclasses drop the per-instance __dict__; dataclass(slots=...)
+# is only available from Python 3.10.
+SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**SLOTS)
 class ApiDetails:
     """Configuration class for the API details."""
 
@@ -14,7 +19,7 @@ class ApiDetails:
     model_name: str
 
 
-@dataclass
+@dataclass(**SLOTS)
 class CommitInfo:
     """Dataclass for commit information"""
 
@@ -32,7 +37,7 @@ class Platform(Enum):
     GITHUB = "github"
 
 
-@dataclass
+@dataclass(**SLOTS)
 class WorkItemType:
     """Dataclass for work item types"""
 
@@ -42,7 +47,7 @@ class WorkItemType:
 
 
 # pylint: disable=too-many-instance-attributes
-@dataclass
+@dataclass(**SLOTS)
 class WorkItem:
     """Dataclass for work items"""
 
@@ -70,7 +75,7 @@ class WorkItem:
     comments: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**SLOTS)
 class PlatformInfo:
     """Represents the platform information."""
 
@@ -1,18 +1,28 @@
 """ Complex types used in the project. """
 
 from typing import List, TypeVar, Generic
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields, replace
 
-from .base_types import WorkItem, PlatformInfo
+from .base_types import SLOTS, WorkItem, PlatformInfo
 
+# WorkItem field names in constructor order, for positional copies
+_WORK_ITEM_FIELDS = tuple(f.name for f in fields(WorkItem))
 
-@dataclass
+
+@dataclass(**SLOTS)
 class HierarchicalWorkItem(WorkItem):
     """Represents a work item with children."""
 
     children: List["HierarchicalWorkItem"] = field(default_factory=list)
     children_by_type: List["WorkItemGroup"] = field(default_factory=list)
 
+    @classmethod
+    def from_work_item(cls, work_item: WorkItem) -> "HierarchicalWorkItem":
+        """Create a hierarchical work item from a work item."""
+        if isinstance(work_item, cls):
+            return replace(work_item)
+        return cls(*(getattr(work_item, name) for name in _WORK_ITEM_FIELDS))
+
 
 @dataclass
 class Notes:
@@ -1,8 +1,10 @@
 """Work module for changelog-weaver"""
 
-from typing import Dict, List, Union, Optional
+from typing import Dict, Iterator, List, Set, Union, Optional
 import asyncio
+import logging
 import time
+from contextlib import contextmanager
 from .configuration import Config
 from .typings import (
     HierarchicalWorkItem,
@@ -25,6 +27,25 @@ from .logger import get_logger
 log = get_logger(__name__)
 
 
+@contextmanager
+def _timed(name: str) -> Iterator[None]:
+    """Log the elapsed time of the block at debug level, if enabled."""
+    if not log.isEnabledFor(logging.DEBUG):
+        yield
+        return
+    start_time = time.perf_counter()
+    try:
+        yield
+    finally:
+        log.debug("%s took %.3f seconds", name, time.perf_counter() - start_time)
+
+
+COMMIT_TYPE = "Commit"
+# Spellings of the commit type that are skipped for summarization
+COMMIT_TYPES = frozenset({COMMIT_TYPE, "commit", "COMMIT"})
+
+
+# pylint: disable=too-many-instance-attributes
 class Work:
     """Class for fetching and summarizing work items from the platform."""
 
@@ -33,7 +54,8 @@ class Work:
         self.all: Dict[int, HierarchicalWorkItem] = {}
         self.root_items: List[HierarchicalWorkItem] = []
         self.by_type: List[WorkItemGroup] = []
-        self.item_ids: List[int] = []
+        self._has_commit_group = False
+        self.item_ids: Set[int] = set()
         self.platform = config.project.platform
         self.client = self._create_platform_client(config)
 
@@ -51,8 +73,10 @@ class Work:
             )
         if self.platform.platform == Platform.GITHUB:
             log.info(
-                f"Creating GitHub client with branch: {config.project.platform.branch}, "
-                f"from_tag: {config.project.platform.from_tag}, to_tag: {config.project.platform.to_tag}"
+                "Creating GitHub client with branch: %s, from_tag: %s, to_tag: %s",
+                config.project.platform.branch,
+                config.project.platform.from_tag,
+                config.project.platform.to_tag,
             )
             return GitHubPlatformClient(
                 GitHubConfig(
@@ -71,10 +95,8 @@ class Work:
     async def initialize(self):
         """Initialize the platform client."""
         log.info("Initializing Work class")
-        start_time = time.time()
-        await self.client.initialize()
-        end_time = time.time()
-        log.info(f"Work class initialized in {end_time - start_time} seconds")
+        with _timed("Work initialization"):
+            await self.client.initialize()
 
     async def close(self):
         """Close the platform client."""
@@ -94,16 +116,28 @@ class Work:
             WorkItem: The work item, potentially with a new summary.
         """
         # Skip summarization for commit items
-        if wi.type.lower() == "commit":
+        if wi.type in COMMIT_TYPES:
             return wi
 
         if not self.config.model.item_summary:
             log.info("Skipping work item summary due to configuration setting")
             return wi
 
-        log.info(f"Summarizing work item {wi.id}")
-        item_prompt: str = self.config.prompts.item
-        prompt = f"{item_prompt}: {wi.title} item type: {wi.type} {wi.description} {wi.comments}"
+        log.info("Summarizing work item %s", wi.id)
+        comments_text = "\n".join(wi.comments)[: self.config.model.max_comment_chars]
+        prompt = "".join(
+            (
+                self.config.prompts.item,
+                ": ",
+                wi.title,
+                " item type: ",
+                wi.type,
+                " ",
+                wi.description or "",
+                " ",
+                comments_text,
+            )
+        )
         wi.summary = await self.config.model.summarise(prompt)
         return wi
 
@@ -123,10 +157,12 @@ class Work:
 
     def add(self, work_item: WorkItem) -> HierarchicalWorkItem:
         """Add a work item to the collection."""
-        if work_item.id not in self.all:
-            hierarchical_item = HierarchicalWorkItem(**work_item.__dict__)
-            self.all[work_item.id] = hierarchical_item
-        return self.all[work_item.id]
+        existing = self.all.get(work_item.id)
+        if existing is not None:
+            return existing
+        hierarchical_item = HierarchicalWorkItem.from_work_item(work_item)
+        self.all[work_item.id] = hierarchical_item
+        return hierarchical_item
 
     async def get_item_by_id(self, item_id: Union[int, str]) -> HierarchicalWorkItem:
         """Get a work item by ID."""
@@ -146,51 +182,73 @@ class Work:
             List[HierarchicalWorkItem]: A list of work items with their details.
         """
         log.info("Starting to fetch work items with details")
-        start_time = time.time()
-        items = await self.client.get_work_items_with_details(**kwargs)
-        if self.platform.platform == Platform.GITHUB:
-            self.root_items = [self.add(item) for item in items]
-            for root_item in self.root_items:
-                for child in root_item.children:
-                    self.all[child.id] = child
-                    self.item_ids.append(child.id)
-        else:  # Azure DevOps
-            self.item_ids = [item.id for item in items]
-            log.info("Fetched %s work items from client", len(items))
-            add_tasks = [self.get_item_by_id(item.id) for item in items]
-            await asyncio.gather(*add_tasks)
-            log.info("Added %s items to the work item collection", len(add_tasks))
-            await self._fetch_parents()
-            log.info("Fetched parent items")
-            self._create_other_parent()
-            log.info("Created 'Other' parent for orphaned items")
-
-        if self.config.model.item_summary:
-            summary_tasks = [
-                self.summarize_work_item(item)
-                for item in self.all.values()
-                if item.id in self.item_ids and item.type.lower() != "commit"
-            ]
-            await asyncio.gather(*summary_tasks)
-
-        if self.platform.platform == Platform.AZURE_DEVOPS:
-            hierarchy = Hierarchy(self.all)
-            self.root_items = hierarchy.root_items
-            self.by_type = hierarchy.by_type
-        else:
-            self.by_type = [
-                WorkItemGroup(
-                    type=root_item.type, icon=root_item.icon, items=root_item.children
+        with _timed("Fetching work items with details"):
+            items = await self.client.get_work_items_with_details(**kwargs)
+            if self.platform.platform == Platform.GITHUB:
+                self.root_items = [self.add(item) for item in items]
+                seen_ids: Set[int] = set()
+                for root_item in self.root_items:
+                    # Drop children already listed under an earlier root so each
+                    # item is summarized and rendered once, from one instance
+                    unique_children: List[HierarchicalWorkItem] = []
+                    for child in root_item.children:
+                        if child.id in seen_ids:
+                            continue
+                        seen_ids.add(child.id)
+                        self.item_ids.add(child.id)
+                        unique_children.append(self.all.setdefault(child.id, child))
+                    root_item.children = unique_children
+            else:  # Azure DevOps
+                self.item_ids = {item.id for item in items}
+                log.info("Fetched %s work items from client", len(items))
+                add_tasks = [self.get_item_by_id(item.id) for item in items]
+                await asyncio.gather(*add_tasks)
+                log.info(
+                    "Added %s items to the work item collection", len(add_tasks)
                 )
-                for root_item in self.root_items
-            ]
-
-        log.info(f"Total root items: {len(self.root_items)}")
-        log.info(f"Total by_type groups: {len(self.by_type)}")
-        end_time = time.time()
-        log.info(
-            "Fetched and processed work items in %.2f seconds", end_time - start_time
-        )
+                await self._fetch_parents()
+                log.info("Fetched parent items")
+                self._create_other_parent()
+                log.info("Created 'Other' parent for orphaned items")
+
+            if self.config.model.item_summary and self.item_ids:
+                semaphore = asyncio.Semaphore(
+                    max(1, self.config.model.max_concurrency)
+                )
+
+                async def summarize_bounded(item: HierarchicalWorkItem) -> WorkItem:
+                    async with semaphore:
+                        return await self.summarize_work_item(item)
+
+                summary_tasks = [
+                    summarize_bounded(item)
+                    for item in self.all.values()
+                    if item.id in self.item_ids and item.type not in COMMIT_TYPES
+                ]
+                await asyncio.gather(*summary_tasks)
+
+            # by_type is rebuilt below without the commits group
+            self._has_commit_group = False
+            if self.platform.platform == Platform.AZURE_DEVOPS:
+                hierarchy = Hierarchy(self.all)
+                self.root_items = hierarchy.root_items
+                self.by_type = hierarchy.by_type
+            else:
+                groups: Dict[str, WorkItemGroup] = {}
+                for root_item in self.root_items:
+                    group = groups.get(root_item.type)
+                    if group is None:
+                        groups[root_item.type] = WorkItemGroup(
+                            type=root_item.type,
+                            icon=root_item.icon,
+                            items=list(root_item.children),
+                        )
+                    else:
+                        group.items.extend(root_item.children)
+                self.by_type = list(groups.values())
+
+            log.info("Total root items: %s", len(self.root_items))
+            log.info("Total by_type groups: %s", len(self.by_type))
         return self.root_items
 
     def _convert_commit_to_work_item(self, commit: CommitInfo) -> HierarchicalWorkItem:
@@ -204,8 +262,10 @@ class Work:
             HierarchicalWorkItem: The converted work item representing the commit.
         """
         return HierarchicalWorkItem(
-            id=hash(commit.sha),  # Use hash of SHA as ID
-            type="Commit",
+            # First 60 bits of the SHA, with a high bit set so commit IDs never
+            # collide with platform work item IDs
+            id=int(commit.sha[:15], 16) | (1 << 62),
+            type=COMMIT_TYPE,
             state="N/A",
             title=commit.message,
             icon="https://raw.githubusercontent.com/Hankanman/Changelog-Weaver/refs/heads/main/assets/commit-icon.svg",
@@ -219,29 +279,36 @@ class Work:
         )
 
     async def _fetch_parents(self):
-        if self.platform.platform != Platform.AZURE_DEVOPS:
-            return
+        """Fetch missing ancestors of the collected items (Azure DevOps only)."""
         log.info("Starting to fetch parent items")
-        start_time = time.time()
-        items_to_fetch = set()
-        items_list = list(self.all.values())
-        for item in items_list:
-            current_item = item
-            while current_item.parent_id and current_item.parent_id not in self.all:
-                items_to_fetch.add(current_item.parent_id)
-                current_item = await self.get_item_by_id(current_item.parent_id)
-        log.info(f"Fetching {len(items_to_fetch)} parent items")
-        batch_size = 10
-        for i in range(0, len(items_to_fetch), batch_size):
-            batch = list(items_to_fetch)[i : i + batch_size]
-            parent_fetch_tasks = [self.get_item_by_id(parent_id) for parent_id in batch]
-            await asyncio.gather(*parent_fetch_tasks)
-        end_time = time.time()
-        log.info(f"Fetched parent items in {end_time - start_time:.2f} seconds")
+        with _timed("Fetching parent items"):
+            # Walk the parent chains breadth-first: each wave fetches every
+            # missing parent of the previous wave concurrently.
+            frontier = {
+                item.parent_id
+                for item in self.all.values()
+                if item.parent_id and item.parent_id not in self.all
+            }
+            # Keep up to 10 requests in flight rather than draining fixed batches
+            semaphore = asyncio.Semaphore(10)
+
+            async def fetch_parent(parent_id: int) -> HierarchicalWorkItem:
+                async with semaphore:
+                    return await self.get_item_by_id(parent_id)
+
+            while frontier:
+                log.info("Fetching %s parent items", len(frontier))
+                results = await asyncio.gather(
+                    *(fetch_parent(parent_id) for parent_id in frontier)
+                )
+                frontier = {
+                    item.parent_id
+                    for item in results
+                    if item.parent_id and item.parent_id not in self.all
+                }
 
     def _create_other_parent(self):
-        if self.platform.platform == Platform.GITHUB:
-            return  # GitHub doesn't need an "Other" parent
+        """Group orphaned items under an "Other" parent (Azure DevOps only)."""
         orphaned_items = [
             item for item in self.all.values() if item.orphan and item.id != 0
         ]
@@ -271,30 +338,25 @@ class Work:
             List[WorkItemGroup]: A list of ordered work item groups.
         """
         log.info("Generating ordered work items")
-        start_time = time.time()
-        if not self.by_type:
-            await self.get_items_with_details()
-
-        # Handle commits for both platforms
-        if self.config.include_commits and not any(
-            group.type == "Commit" for group in self.by_type
-        ):
-            log.info("Fetching commits...")
-            commits = await self.client.get_commits()
-            log.info(f"Retrieved {len(commits)} commits")
-            commit_items = [
-                self._convert_commit_to_work_item(commit) for commit in commits
-            ]
-            commits_group = WorkItemGroup(
-                type="Commit",
-                icon="https://raw.githubusercontent.com/Hankanman/Changelog-Weaver/refs/heads/main/assets/commit-icon.svg",
-                items=commit_items,
-            )
-            self.by_type.append(commits_group)
-            log.info(f"Added commits group with {len(commit_items)} commits")
+        with _timed("Generating ordered work items"):
+            if not self.by_type:
+                await self.get_items_with_details()
+
+            # Handle commits for both platforms
+            if self.config.include_commits and not self._has_commit_group:
+                log.info("Fetching commits...")
+                commits = await self.client.get_commits()
+                log.info("Retrieved %s commits", len(commits))
+                commit_items = list(map(self._convert_commit_to_work_item, commits))
+                commits_group = WorkItemGroup(
+                    type=COMMIT_TYPE,
+                    icon="https://raw.githubusercontent.com/Hankanman/Changelog-Weaver/refs/heads/main/assets/commit-icon.svg",
+                    items=commit_items,
+                )
+                self.by_type.append(commits_group)
+                self._has_commit_group = True
+                log.info("Added commits group with %s commits", len(commit_items))
 
-        end_time = time.time()
-        log.info(f"Generated ordered work items in {end_time - start_time:.2f} seconds")
         return self.by_type
 
     def get_work_item_types(self) -> List[WorkItemType]: